@@ -24,8 +24,13 @@ float X_min[I] = ...;        // Límite mínimo por clase (si aplica)
 float X_max[I] = ...;        // Límite máximo por clase (si aplica)
 
 // --- Validación de compatibilidad de límites ---
-assert forall(i in I, c in C)
-  (X_min[i] <= L[c] && L[c] <= U[c] && U[c] <= X_max[i]);
+// La verificación completa y el ajuste de cotas se hacen en Python (utils/feasibility.py);
+// aquí solo se comparan los límites de cada activo con los de su propia clase.
+assert forall(c in C)
+  L[c] <= U[c];
+
+assert forall(i in I, c in C: g[i][c] == 1)
+  (X_min[i] <= X_max[i] && X_min[i] <= U[c]);
 
 
 // --- Variables de decisión ---
@@ -225,3 +230,105 @@ execute {
   writeln("Archivo 'params.txt' generado correctamente.");
 }
 
+main {
+  // --- Flujo de control con registro de la corrida (telemetría) ---
+  // Se escribe run_record.json aunque falle la generación (p. ej. un assert) o no haya solución.
+  var m = thisOplModel;
+  var f = new IloOplOutputFile("run_record.json");
+
+  // Escribe una familia de restricciones como lista de {"index": [...], "dual": d, "slack": s}
+  function writeFamily(name, entries, last) {
+    f.write("    \"" + name + "\": [");
+    for (var k = 0; k < entries.length; k++)
+      f.write((k == 0 ? "\n" : ",\n") + "      {\"index\": [" + entries[k][0] + "], \"dual\": " + entries[k][1].dual + ", \"slack\": " + entries[k][1].slack + "}");
+    f.writeln("\n    ]" + (last ? "" : ","));
+  }
+
+  // Convierte un texto en una cadena JSON (escapa comillas, barras y saltos de línea)
+  function jsonString(text) {
+    var out = "";
+    for (var k = 0; k < text.length; k++) {
+      var ch = text.charAt(k);
+      if (ch == "\"" || ch == "\\")
+        out += "\\" + ch;
+      else if (ch == "\n")
+        out += "\\n";
+      else if (ch == "\r" || ch == "\t")
+        out += " ";
+      else
+        out += ch;
+    }
+    return "\"" + out + "\"";
+  }
+
+  var generated = true;
+  var error = null;
+  try {
+    m.generate();
+  } catch (e) {
+    generated = false;
+    error = e;
+  }
+
+  f.writeln("{");
+  f.writeln("  \"generated\": " + generated + ",");
+
+  if (!generated) {
+    f.writeln("  \"solved\": false,");
+    f.writeln("  \"error\": " + jsonString("" + error));
+    f.writeln("}");
+    f.close();
+    writeln("Falló la generación del modelo; registro exportado a 'run_record.json'");
+
+    // Propagar el error para que oplrun termine con fallo, como antes de la telemetría
+    throw error;
+  } else {
+    // --- Resolución (solo se mide cplex.solve) ---
+    var t0 = new Date().getTime();
+    var solved = cplex.solve();
+    var elapsed = (new Date().getTime() - t0) / 1000;
+
+    f.writeln("  \"solved\": " + solved + ",");
+    f.writeln("  \"model\": {\"rows\": " + cplex.getNrows() + ", \"cols\": " + cplex.getNcols() + ", \"nonzeros\": " + cplex.getNNZs() + ", \"assets\": " + m.I.size + ", \"classes\": " + m.C.size + ", \"periods\": " + m.H + "},");
+    f.writeln("  \"cplex_status\": " + cplex.getCplexStatus() + ",");
+    f.writeln("  \"iterations\": " + cplex.getNiterations() + ",");
+    f.writeln("  \"solve_time_s\": " + elapsed + ",");
+    f.writeln("  \"objective\": " + (solved ? cplex.getObjValue() : "null") + ",");
+    f.writeln("  \"constraints\": {");
+
+    if (solved) {
+      var budget = new Array();
+      var class_min = new Array();
+      var class_max = new Array();
+      var asset_min = new Array();
+      var asset_max = new Array();
+
+      for (var t in m.T) {
+        budget.push([t, m.budget[t]]);
+        for (var c in m.C) {
+          class_min.push(["\"" + c + "\", " + t, m.class_min[c][t]]);
+          class_max.push(["\"" + c + "\", " + t, m.class_max[c][t]]);
+        }
+        for (var i in m.I) {
+          asset_min.push(["\"" + i + "\", " + t, m.asset_min[i][t]]);
+          asset_max.push(["\"" + i + "\", " + t, m.asset_max[i][t]]);
+        }
+      }
+
+      writeFamily("budget", budget, false);
+      writeFamily("class_min", class_min, false);
+      writeFamily("class_max", class_max, false);
+      writeFamily("asset_min", asset_min, false);
+      writeFamily("asset_max", asset_max, true);
+    }
+
+    f.writeln("  }");
+    f.writeln("}");
+    f.close();
+    writeln("Registro de la corrida exportado a 'run_record.json'");
+
+    // --- Exportar results.csv y params.txt (bloques execute de post-procesamiento) ---
+    if (solved)
+      m.postProcess();
+  }
+}
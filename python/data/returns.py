@@ -1,17 +1,14 @@
-from pandas.tseries.offsets import DateOffset
-import pandas as pd
-import yfinance as yf
-from typing import List
-
 from typing import List, Optional, Tuple
 import pandas as pd
-import yfinance as yf
+
+from data.scheduler import DownloadScheduler, get_default_scheduler
 
 def download_close(
     tickers: List[str],
     period: str = "1y",
     interval: str = "1d",
-    date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] = None
+    date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] = None,
+    scheduler: Optional[DownloadScheduler] = None
 ) -> pd.DataFrame:
     """
     Descarga los precios de cierre ('Close') de los tickers indicados usando yfinance.
@@ -27,43 +24,33 @@ def download_close(
     - date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] ->
         tupla (start_date, end_date). Si se especifica, ignora 'period'.
         Si end_date es None, se usa la fecha actual.
+    - scheduler: Optional[DownloadScheduler] ->
+        planificador que reparte la descarga en lotes concurrentes con reintentos.
+        Si no se especifica, se usa el planificador compartido del proceso.
     
     Retorna:
     ----------
     pd.DataFrame:
         DataFrame con índice = fechas, columnas = tickers y valores = precios de cierre.
+        Los tickers que no se pudieron descargar se omiten y se listan en df.attrs['failed_tickers'].
     """
+    if scheduler is None:
+        scheduler = get_default_scheduler()
+
     # Determine how to fetch data
     if date_range is not None:
         start_date, end_date = date_range
         if end_date is None:
-            end_date = pd.Timestamp.today()
-        df = yf.download(
-            tickers=tickers,
-            start=start_date,
-            end=end_date,
-            interval=interval,
-            progress=False,
-            threads=True
-        )['Close']
+            end_date = pd.Timestamp.today().normalize()
+        df = scheduler.download(tickers, start=start_date, end=end_date, interval=interval)
     else:
-        df = yf.download(
-            tickers=tickers,
-            period=period,
-            interval=interval,
-            progress=False,
-            threads=True
-        )['Close']
+        df = scheduler.download(tickers, period=period, interval=interval)
 
-    # Convert Series to DataFrame if only one ticker
-    if isinstance(df, pd.Series):
-        df = df.to_frame()
-    
-    return df
+    if df.attrs.get('failed_tickers'):
+        print(f"Advertencia: no se pudieron descargar {df.attrs['failed_tickers']}")
 
+    return df
 
-from typing import List, Optional, Tuple
-import pandas as pd
 
 def expected_returns(
     tickers: List[str],
@@ -71,7 +58,8 @@ def expected_returns(
     price_interval: str = "1d",
     freq: str = "M",
     lambda_: float = 0.94,
-    date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] = None
+    date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] = None,
+    scheduler: Optional[DownloadScheduler] = None
 ) -> pd.DataFrame:
     """
     Calcula los retornos esperados usando EWMA para una lista de tickers.
@@ -91,21 +79,24 @@ def expected_returns(
     - date_range: Optional[Tuple[pd.Timestamp, Optional[pd.Timestamp]]] ->
         tupla (start_date, end_date). Si se especifica, ignora 'period'.
         Si end_date es None, se usa la fecha actual como límite superior.
+    - scheduler: Optional[DownloadScheduler] ->
+        planificador de descargas (ver download_close).
     
     Retorna:
     ----------
     pd.DataFrame:
-        DataFrame con índice = períodos de decisión (final de mes, semana, etc.)
-        y columnas = tickers. Cada valor es el retorno esperado EWMA para ese período.
+        DataFrame con índice = tickers y columnas = períodos de decisión (final de mes,
+        semana, etc.). Cada valor es el retorno esperado EWMA para ese período.
+        Los tickers que no se pudieron descargar se omiten y se listan en df.attrs['failed_tickers'].
     """
     # 1. Descargar precios de cierre
     if date_range is not None:
         start_date, end_date = date_range
         if end_date is None:
             end_date = pd.Timestamp.today()
-        prices_df = download_close(tickers, date_range=date_range, interval=price_interval)
+        prices_df = download_close(tickers, date_range=date_range, interval=price_interval, scheduler=scheduler)
     else:
-        prices_df = download_close(tickers, period=period, interval=price_interval)
+        prices_df = download_close(tickers, period=period, interval=price_interval, scheduler=scheduler)
 
     # 2. Calcular retornos simples diarios
     returns = prices_df.pct_change().dropna()
@@ -134,6 +125,8 @@ def expected_returns(
     ewma_returns.index = new_dates
 
 
-    # 6. Retornar transpuesta (tickers como filas)
-    return ewma_returns.T
+    # 6. Retornar transpuesta (tickers como filas), conservando los tickers fallidos
+    result = ewma_returns.T
+    result.attrs['failed_tickers'] = list(prices_df.attrs.get('failed_tickers', []))
+    return result
 
@@ -0,0 +1,284 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Clave de una descarga: (ticker, start, end, period, interval)
+RequestKey = Tuple[str, Optional[str], Optional[str], Optional[str], str]
+
+# Firma de la función de descarga: (tickers, start, end, period, interval) -> DataFrame de cierres
+FetchFn = Callable[
+    [List[str], Optional[pd.Timestamp], Optional[pd.Timestamp], Optional[str], str],
+    pd.DataFrame
+]
+
+
+def yf_fetch_close(
+    tickers: List[str],
+    start: Optional[pd.Timestamp],
+    end: Optional[pd.Timestamp],
+    period: Optional[str],
+    interval: str
+) -> pd.DataFrame:
+    """
+    Descarga los precios de cierre de un lote de tickers con yfinance.
+
+    Cada ticker se descarga con yf.Ticker(t).history(...) y no con yf.download:
+    yf.download guarda sus resultados en variables globales del módulo (yfinance.shared)
+    que reinicia en cada llamada, por lo que no es seguro llamarlo desde varios hilos.
+    Dentro de un lote los tickers se descargan en secuencia; el paralelismo lo dan los
+    lotes que el scheduler ejecuta a la vez.
+
+    Igual que yf.download, se elimina la zona horaria del índice para poder alinear
+    activos de mercados distintos.
+    """
+    import yfinance as yf
+
+    closes: Dict[str, pd.Series] = {}
+    for ticker in tickers:
+        if start is not None:
+            history = yf.Ticker(ticker).history(start=start, end=end, interval=interval)
+        else:
+            history = yf.Ticker(ticker).history(period=period, interval=interval)
+
+        if history.empty:
+            continue
+
+        close = history['Close']
+        if close.index.tz is not None:
+            close.index = close.index.tz_localize(None)
+        closes[ticker] = close
+
+    return pd.DataFrame(closes)
+
+
+class DownloadScheduler:
+    """
+    Planificador de descargas de precios por lotes.
+
+    Divide el universo de tickers en lotes de tamaño 'batch_size' y los descarga en
+    paralelo con a lo sumo 'max_workers' hilos. Cada lote se reintenta con backoff
+    exponencial; si un lote falla definitivamente, se descarga ticker por ticker para
+    aislar los símbolos problemáticos. Los tickers que no se pudieron descargar se omiten
+    del resultado y se listan en df.attrs['failed_tickers'].
+
+    Las solicitudes en curso para el mismo (ticker, rango) se comparten entre llamadas
+    concurrentes, de modo que un ticker no se descarga dos veces a la vez.
+
+    Parámetros:
+    ----------
+    - fetch_fn: FetchFn ->
+        función que descarga un lote. Por defecto usa yfinance; en pruebas puede
+        reemplazarse por un stub local que inyecte latencia o fallos.
+    - batch_size: int ->
+        número de tickers por lote (un lote se descarga en secuencia dentro de un hilo).
+    - max_workers: int ->
+        número máximo de lotes descargándose simultáneamente.
+    - max_retries: int ->
+        reintentos por lote (o por ticker) tras el primer intento fallido.
+    - backoff: float ->
+        espera base en segundos; el intento k espera backoff * 2**k.
+    - sleep_fn: Callable[[float], None] ->
+        función de espera (inyectable para pruebas).
+    """
+
+    def __init__(
+        self,
+        fetch_fn: FetchFn = yf_fetch_close,
+        batch_size: int = 2,
+        max_workers: int = 4,
+        max_retries: int = 2,
+        backoff: float = 0.5,
+        sleep_fn: Callable[[float], None] = time.sleep
+    ):
+        if batch_size < 1:
+            raise ValueError("'batch_size' debe ser mayor o igual a 1.")
+        if max_workers < 1:
+            raise ValueError("'max_workers' debe ser mayor o igual a 1.")
+        if max_retries < 0:
+            raise ValueError("'max_retries' no puede ser negativo.")
+
+        self.fetch_fn = fetch_fn
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.sleep_fn = sleep_fn
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = threading.Lock()
+        self._inflight: Dict[RequestKey, Future] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Libera los hilos del planificador."""
+        self._executor.shutdown(wait=True)
+
+    def download(
+        self,
+        tickers: List[str],
+        start: Optional[pd.Timestamp] = None,
+        end: Optional[pd.Timestamp] = None,
+        period: Optional[str] = "1y",
+        interval: str = "1d"
+    ) -> pd.DataFrame:
+        """
+        Descarga los precios de cierre de 'tickers' repartidos en lotes concurrentes.
+
+        Si se especifica 'start', se ignora 'period'.
+
+        Retorna:
+        ----------
+        pd.DataFrame:
+            DataFrame con índice = fechas y columnas = tickers descargados (ordenados
+            alfabéticamente). df.attrs['failed_tickers'] contiene los tickers omitidos.
+        """
+        if start is not None:
+            start = pd.Timestamp(start)
+            end = pd.Timestamp(end) if end is not None else None
+            period = None
+
+        # 1. Registrar lotes nuevos y reutilizar solicitudes en curso
+        unique_tickers = list(dict.fromkeys(tickers))
+        futures: Dict[str, Future] = {}
+        pending: List[str] = []
+        submitted: List[Tuple[Future, List[RequestKey]]] = []
+
+        with self._lock:
+            for ticker in unique_tickers:
+                key = self._key(ticker, start, end, period, interval)
+                if key in self._inflight:
+                    futures[ticker] = self._inflight[key]
+                else:
+                    pending.append(ticker)
+
+            for i in range(0, len(pending), self.batch_size):
+                batch = pending[i:i + self.batch_size]
+                future = self._executor.submit(
+                    self._fetch_batch, batch, start, end, period, interval
+                )
+                keys = [self._key(t, start, end, period, interval) for t in batch]
+                for ticker, key in zip(batch, keys):
+                    self._inflight[key] = future
+                    futures[ticker] = future
+                submitted.append((future, keys))
+
+        # Registrar la liberación fuera del lock: si el lote ya terminó,
+        # add_done_callback ejecuta _release en este mismo hilo
+        for future, keys in submitted:
+            future.add_done_callback(lambda _, keys=keys: self._release(keys))
+
+        # 2. Recolectar resultados por ticker
+        columns: Dict[str, pd.Series] = {}
+        failed: List[str] = []
+        for ticker in unique_tickers:
+            batch_df = futures[ticker].result()
+            if ticker in batch_df.columns:
+                columns[ticker] = batch_df[ticker]
+            else:
+                failed.append(ticker)
+
+        # Columnas ordenadas por ticker, igual que yf.download
+        df = pd.DataFrame(columns)[sorted(columns)]
+        df.attrs['failed_tickers'] = failed
+        return df
+
+    def _fetch_batch(
+        self,
+        batch: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        period: Optional[str],
+        interval: str
+    ) -> pd.DataFrame:
+        """
+        Descarga un lote con reintentos. Si falla, lo descarga ticker por ticker.
+
+        Las columnas ausentes o sin ningún dato se consideran fallidas.
+        """
+        try:
+            df = self._fetch_with_retries(batch, start, end, period, interval)
+        except Exception:
+            if len(batch) == 1:
+                return pd.DataFrame()
+            df = None
+
+        if df is not None:
+            missing = [t for t in batch if t not in df.columns]
+            if len(batch) == 1 or not missing:
+                return df
+            parts = [df]
+        else:
+            missing = batch
+            parts = []
+
+        # Aislar los tickers que faltan para que no arrastren al resto del lote
+        for ticker in missing:
+            try:
+                parts.append(self._fetch_with_retries([ticker], start, end, period, interval))
+            except Exception:
+                continue
+        return pd.concat(parts, axis=1) if parts else pd.DataFrame()
+
+    def _fetch_with_retries(
+        self,
+        batch: List[str],
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        period: Optional[str],
+        interval: str
+    ) -> pd.DataFrame:
+        for attempt in range(self.max_retries + 1):
+            try:
+                df = self.fetch_fn(batch, start, end, period, interval)
+                # Descartar columnas vacías (yfinance devuelve NaN para tickers inválidos)
+                df = df.loc[:, df.notna().any(axis=0)]
+                if df.shape[1] == 0:
+                    raise ValueError(f"No se obtuvieron datos para {batch}.")
+                return df
+            except Exception:
+                if attempt == self.max_retries:
+                    raise
+                self.sleep_fn(self.backoff * 2 ** attempt)
+
+    def _release(self, keys: List[RequestKey]):
+        with self._lock:
+            for key in keys:
+                self._inflight.pop(key, None)
+
+    @staticmethod
+    def _key(
+        ticker: str,
+        start: Optional[pd.Timestamp],
+        end: Optional[pd.Timestamp],
+        period: Optional[str],
+        interval: str
+    ) -> RequestKey:
+        return (
+            ticker,
+            None if start is None else str(start),
+            None if end is None else str(end),
+            period,
+            interval
+        )
+
+
+_default_scheduler: Optional[DownloadScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler() -> DownloadScheduler:
+    """
+    Retorna el planificador compartido por todo el proceso, creándolo si no existe.
+    """
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = DownloadScheduler()
+        return _default_scheduler
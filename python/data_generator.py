@@ -3,6 +3,7 @@ import pandas as pd
 from data.returns import expected_returns
 from data.tickers import get_ticker_types, build_g_matrix, asset_limits, class_limits, generate_transaction_costs
 from utils.cplex_dat import export_to_cplex_dat
+from utils.feasibility import tighten_limits
 
 # Fechas para rangos en predicción de precios (opcional)
 today = pd.Timestamp.today().normalize()
@@ -12,6 +13,11 @@ end_date = today - pd.DateOffset(months=13)
 # Obtener un conjunto de datos inicial (Periodo de dos meses con periodos de decisión semanales)
 tickers = get_ticker_types(n = 10, initial_tickers=["AAPL", "SPY", "EURUSD=X", "BTC-USD", "ES=F", "NVDA", "MSFT"])
 exp_returns = expected_returns(list(tickers.keys()), period="1mo", price_interval="1d", freq="W", date_range=(start_date, end_date))
+
+# Excluir del universo los tickers que no se pudieron descargar
+for ticker in exp_returns.attrs.get('failed_tickers', []):
+    tickers.pop(ticker, None)
+
 g_matrix = build_g_matrix(tickers)
 
 # --- Conjuntos ---
@@ -22,6 +28,9 @@ print("Activos financieros (I)")
 I = list(sorted(tickers.keys()))
 print(I, '\n')
 
+# Las filas de r se exportan por posición: deben seguir el orden de I
+exp_returns = exp_returns.reindex(I)
+
 # -- Periodos de decisión (T) --
 T = list(exp_returns.columns)
 print("Periodos de decisión (T)")
@@ -62,5 +71,11 @@ print(L_c, U_c)
 x_min, x_max = asset_limits(I)
 print(x_min, x_max)
 
+# -- Verificación de factibilidad y ajuste de límites (antes de resolver) --
+L_c, U_c, x_min, x_max = tighten_limits(g_matrix, L_c, U_c, x_min, x_max)
+print("Límites ajustados:")
+print(L_c, U_c)
+print(x_min, x_max, "\n")
+
 # Generar el archivo .dat
 export_to_cplex_dat("portfolio.dat", I, T, C, W0, exp_returns, c_buy, c_sell, g_matrix, L_c, U_c, x_min, x_max)
\ No newline at end of file
@@ -1,6 +1,12 @@
+import os
+import sys
+
 import pandas as pd
 from perf_comparator import simulate_real_vs_plan
-import yfinance as yf
+
+# Permite importar el paquete 'data' (python/) al ejecutar este script directamente
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from data.returns import download_close
 
 def read_W0_from_params(file_path: str = "params.txt") -> float:
     """
@@ -91,14 +97,7 @@ elif difference <= 31:
 else:
     frequency = "Y"
 
-prices_df = yf.download(
-    tickers=tickers,
-    start=start_date,
-    end=end_date,
-    interval="1d",
-    progress=False,
-    threads=True
-)['Close']
+prices_df = download_close(tickers, interval="1d", date_range=(start_date, end_date))
 
 returns = prices_df.dropna().pct_change()
 returns = (1 + returns).resample(frequency).prod() - 1
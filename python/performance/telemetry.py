@@ -0,0 +1,212 @@
+import json
+import os
+import re
+from typing import Dict, Optional
+
+import pandas as pd
+
+# Familias de restricciones exportadas en run_record.json por Portfolio.mod
+CONSTRAINT_FAMILIES = ["budget", "class_min", "class_max", "asset_min", "asset_max"]
+
+
+def load_run_record(file_path: str = "run_record.json") -> Dict:
+    """
+    Lee el registro de una corrida exportado por OPL.
+
+    Parámetros
+    ----------
+    file_path : str
+        Ruta al archivo run_record.json (junto a results.csv).
+
+    Retorna
+    -------
+    dict
+        Registro con 'generated'/'solved', tamaño del modelo, estado, iteraciones, tiempo,
+        objetivo y duales/holguras por familia de restricciones. Si la generación falló
+        (p. ej. por un assert), solo contiene 'generated', 'solved' y 'error' (el mensaje
+        de OPL); si no hubo solución, 'objective' es None y no hay restricciones.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_presolve_log(file_path: str) -> Dict[str, int]:
+    """
+    Extrae las reducciones del presolve desde el log del motor CPLEX.
+
+    OPL no expone las estadísticas del presolve en scripting, por lo que se leen del log
+    del motor. Portfolio.mod no lo escribe: se obtiene redirigiendo la salida de oplrun
+    a la carpeta de la corrida, por ejemplo
+
+        oplrun -v Portfolio.mod Portfolio.dat > cplex.log 2>&1
+
+    o guardando la pestaña "Engine log" del IDE como cplex.log.
+
+    Parámetros
+    ----------
+    file_path : str
+        Ruta al log de CPLEX.
+
+    Retorna
+    -------
+    dict
+        Filas/columnas eliminadas y tamaño del modelo reducido. Vacío si no se encuentran.
+    """
+    with open(file_path, "r", encoding="utf-8") as f:
+        log = f.read()
+
+    stats: Dict[str, int] = {}
+
+    eliminated = re.search(r"Presolve eliminated (\d+) rows and (\d+) columns", log)
+    if eliminated:
+        stats["presolve_rows_removed"] = int(eliminated.group(1))
+        stats["presolve_cols_removed"] = int(eliminated.group(2))
+
+    reduced = re.search(r"Reduced \w+ has (\d+) rows, (\d+) columns, and (\d+) nonzeros", log)
+    if reduced:
+        stats["reduced_rows"] = int(reduced.group(1))
+        stats["reduced_cols"] = int(reduced.group(2))
+        stats["reduced_nonzeros"] = int(reduced.group(3))
+
+    return stats
+
+
+def constraint_table(record: Dict, tol: float = 1e-6) -> pd.DataFrame:
+    """
+    Convierte los duales y holguras del registro en una tabla larga.
+
+    Parámetros
+    ----------
+    record : dict
+        Registro leído con load_run_record.
+    tol : float
+        Tolerancia para considerar una restricción activa (|holgura| <= tol).
+
+    Retorna
+    -------
+    pd.DataFrame
+        Columnas ['family', 'index', 'dual', 'slack', 'binding'], una fila por restricción.
+    """
+    rows = []
+    for family in CONSTRAINT_FAMILIES:
+        for entry in record.get("constraints", {}).get(family, []):
+            rows.append({
+                "family": family,
+                "index": tuple(entry["index"]),
+                "dual": entry["dual"],
+                "slack": entry["slack"],
+            })
+
+    table = pd.DataFrame(rows, columns=["family", "index", "dual", "slack"])
+    table["binding"] = table["slack"].abs() <= tol
+    return table
+
+
+def summarize_run(run_dir: str, tol: float = 1e-6, log_name: str = "cplex.log") -> Optional[Dict]:
+    """
+    Resume en una fila la telemetría de una corrida.
+
+    Parámetros
+    ----------
+    run_dir : str
+        Carpeta de la corrida (la que contiene results.csv y run_record.json).
+    tol : float
+        Tolerancia para restricciones activas.
+    log_name : str
+        Nombre del log de CPLEX dentro de run_dir; se usa solo si existe.
+
+    Retorna
+    -------
+    dict | None
+        Métricas planas de la corrida, o None si no hay run_record.json.
+    """
+    record_path = os.path.join(run_dir, "run_record.json")
+    if not os.path.exists(record_path):
+        return None
+
+    record = load_run_record(record_path)
+    model = record.get("model", {})
+
+    summary = {
+        "run": os.path.basename(os.path.normpath(run_dir)),
+        "has_record": True,
+        "generated": record.get("generated"),
+        "solved": record.get("solved"),
+        "error": record.get("error"),
+        "cplex_status": record.get("cplex_status"),
+        "rows": model.get("rows"),
+        "cols": model.get("cols"),
+        "nonzeros": model.get("nonzeros"),
+        "assets": model.get("assets"),
+        "classes": model.get("classes"),
+        "periods": model.get("periods"),
+        "iterations": record.get("iterations"),
+        "solve_time_s": record.get("solve_time_s"),
+        "objective": record.get("objective"),
+    }
+
+    log_path = os.path.join(run_dir, log_name)
+    summary["has_presolve_log"] = os.path.exists(log_path)
+    if summary["has_presolve_log"]:
+        summary.update(parse_presolve_log(log_path))
+
+    # Activas y magnitud de duales por familia
+    table = constraint_table(record, tol)
+    for family in CONSTRAINT_FAMILIES:
+        family_table = table[table["family"] == family]
+        summary[f"{family}_binding"] = int(family_table["binding"].sum())
+        summary[f"{family}_abs_dual"] = float(family_table["dual"].abs().sum())
+
+    return summary
+
+
+def aggregate_runs(
+    base_path: str = "./model/evaluation",
+    output: Optional[str] = "runs_summary.csv",
+    tol: float = 1e-6
+) -> pd.DataFrame:
+    """
+    Agrega la telemetría de todas las corridas bajo base_path.
+
+    Parámetros
+    ----------
+    base_path : str
+        Carpeta con una subcarpeta por corrida (eval1, eval2, ...).
+    output : str | None
+        Nombre del CSV a escribir dentro de base_path. Si es None, no se escribe.
+    tol : float
+        Tolerancia para restricciones activas.
+
+    Retorna
+    -------
+    pd.DataFrame
+        Una fila por corrida, ordenadas por nombre de carpeta. Las corridas con results.csv
+        pero sin run_record.json se marcan con has_record = False.
+
+    Las columnas del presolve solo se llenan si la corrida tiene cplex.log (la salida de
+    oplrun redirigida a la carpeta de la corrida; ver parse_presolve_log). Si no,
+    has_presolve_log = False.
+    """
+    summaries = []
+    for name in sorted(os.listdir(base_path)):
+        run_dir = os.path.join(base_path, name)
+        if not os.path.isdir(run_dir):
+            continue
+        summary = summarize_run(run_dir, tol)
+        if summary is None:
+            if not os.path.exists(os.path.join(run_dir, "results.csv")):
+                continue
+            print(f"Advertencia: '{name}' no tiene run_record.json")
+            summary = {"run": name, "has_record": False}
+        summaries.append(summary)
+
+    df = pd.DataFrame(summaries)
+
+    if output is not None:
+        df.to_csv(os.path.join(base_path, output), index=False)
+
+    return df
+
+
+if __name__ == "__main__":
+    print(aggregate_runs())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Los módulos se importan como 'data.*' / 'utils.*', igual que en data_generator.py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
@@ -0,0 +1,52 @@
+import pandas as pd
+import pytest
+
+from utils.feasibility import check_limits, tighten_limits
+
+ASSETS = ["AAPL", "BND", "MSFT", "SPY"]
+CLASSES = ["Acciones", "Bonos", "ETF"]
+
+
+def g_matrix():
+    return pd.DataFrame(
+        [[1, 0, 0], [0, 1, 0], [1, 0, 0], [0, 0, 1]], index=ASSETS, columns=CLASSES
+    )
+
+
+def limits(L, U, x_min, x_max):
+    return (
+        pd.DataFrame({"L_c": L}, index=CLASSES),
+        pd.DataFrame({"U_c": U}, index=CLASSES),
+        pd.DataFrame({"x_i_min": x_min}, index=ASSETS),
+        pd.DataFrame({"x_i_max": x_max}, index=ASSETS),
+    )
+
+
+def test_default_limits_are_tightened():
+    L_c, U_c, x_min, x_max = limits([0.1] * 3, [0.75] * 3, [0] * 4, [0.75] * 4)
+    assert check_limits(g_matrix(), L_c, U_c, x_min, x_max) == []
+
+    _, _, lo, _ = tighten_limits(g_matrix(), L_c, U_c, x_min, x_max)
+    # BND y SPY son los únicos activos de su clase: deben cubrir L completo
+    assert lo.loc["BND", "x_i_min"] == pytest.approx(0.1)
+    assert lo.loc["SPY", "x_i_min"] == pytest.approx(0.1)
+
+
+def test_class_minimums_above_one_are_rejected_or_repaired():
+    args = limits([0.5] * 3, [0.75] * 3, [0] * 4, [0.75] * 4)
+    with pytest.raises(ValueError):
+        tighten_limits(g_matrix(), *args)
+
+    # Se repara con margen: con sum L = 1 el capital no podría crecer
+    L_c, _, _, _ = tighten_limits(g_matrix(), *args, repair=True, margin=0.05)
+    assert L_c["L_c"].sum() == pytest.approx(0.95)
+
+
+def test_minimums_raised_by_tightening_are_rechecked():
+    # Pasa la verificación inicial, pero el ajuste eleva sum X_min por encima de 1
+    args = limits([0.3] * 3, [0.9] * 3, [0, 0.45, 0.2, 0.3], [0.2, 0.9, 0.2, 0.9])
+    assert check_limits(g_matrix(), *args) == []
+
+    for repair in (False, True):
+        with pytest.raises(ValueError, match="tras la reparación"):
+            tighten_limits(g_matrix(), *args, repair=repair)
@@ -0,0 +1,155 @@
+import sys
+import threading
+import time
+import types
+from collections import Counter
+
+import pandas as pd
+import pytest
+
+from data.returns import expected_returns
+from data.scheduler import DownloadScheduler, yf_fetch_close
+
+
+class StubFetcher:
+    """
+    Descarga simulada: espera 'latency' segundos por lote y falla si el lote contiene
+    algún ticker de 'bad'. Registra cuántas veces se pidió cada ticker.
+    """
+
+    def __init__(self, latency=0.0, bad=()):
+        self.latency = latency
+        self.bad = set(bad)
+        self.calls = Counter()
+        self.started = threading.Event()
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, tickers, start, end, period, interval):
+        with self._lock:
+            self.calls.update(tickers)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        self.started.set()
+        try:
+            time.sleep(self.latency)
+            if self.bad.intersection(tickers):
+                raise ConnectionError(f"Fallo simulado para {tickers}")
+            index = pd.date_range("2025-01-01", periods=3, freq="D")
+            return pd.DataFrame({t: [1.0, 2.0, 3.0] for t in tickers}, index=index)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_zero_latency_does_not_hang():
+    # Un lote que termina antes de registrar su callback no debe bloquear al llamador
+    tickers = [f"T{i}" for i in range(20)]
+    frames = {t: pd.DataFrame({t: [1.0]}) for t in tickers}
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    scheduler = DownloadScheduler(
+        fetch_fn=lambda batch, *_: frames[batch[0]], batch_size=1, max_workers=4
+    )
+    results = []
+
+    def run():
+        for _ in range(200):
+            results.append(list(scheduler.download(tickers).columns))
+
+    worker = threading.Thread(target=run, daemon=True)
+    try:
+        worker.start()
+        worker.join(timeout=10)
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert not worker.is_alive(), "download() quedó bloqueado"
+    assert results == [sorted(tickers)] * 200
+    scheduler.close()
+
+
+def test_failing_ticker_is_isolated_with_backoff():
+    stub = StubFetcher(bad={"BAD"})
+    sleeps = []
+    with DownloadScheduler(
+        fetch_fn=stub, batch_size=3, max_retries=2, backoff=0.5, sleep_fn=sleeps.append
+    ) as scheduler:
+        df = scheduler.download(["AAPL", "BAD", "MSFT"])
+
+    assert list(df.columns) == ["AAPL", "MSFT"]
+    assert df.attrs["failed_tickers"] == ["BAD"]
+    # 3 intentos del lote + 3 intentos individuales de BAD; AAPL y MSFT una vez más cada uno
+    assert stub.calls["BAD"] == 6
+    assert stub.calls["AAPL"] == 4
+    assert sleeps[:2] == [0.5, 1.0]
+
+
+def test_concurrent_duplicate_requests_share_download():
+    stub = StubFetcher(latency=0.3)
+    results = {}
+    with DownloadScheduler(fetch_fn=stub, batch_size=2, max_workers=2) as scheduler:
+        first = threading.Thread(
+            target=lambda: results.update(first=scheduler.download(["AAPL", "MSFT"]))
+        )
+        first.start()
+        stub.started.wait(timeout=5)
+        results["second"] = scheduler.download(["AAPL", "MSFT"])
+        first.join()
+
+    assert stub.calls == Counter({"AAPL": 1, "MSFT": 1})
+    pd.testing.assert_frame_equal(results["first"], results["second"])
+
+
+def test_columns_are_sorted_like_yf_download():
+    stub = StubFetcher()
+    with DownloadScheduler(fetch_fn=stub, batch_size=2) as scheduler:
+        df = scheduler.download(["SPY", "AAPL", "NVDA", "BTC-USD"])
+
+    assert list(df.columns) == ["AAPL", "BTC-USD", "NVDA", "SPY"]
+
+
+def test_expected_returns_keeps_failed_tickers():
+    stub = StubFetcher(bad={"BAD"})
+    with DownloadScheduler(fetch_fn=stub, max_retries=0) as scheduler:
+        exp_returns = expected_returns(["SPY", "BAD", "AAPL"], freq="D", scheduler=scheduler)
+
+    assert list(exp_returns.index) == ["AAPL", "SPY"]
+    assert exp_returns.attrs["failed_tickers"] == ["BAD"]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_batches_overlap_up_to_max_workers(max_workers):
+    # Se mide la concurrencia máxima en el stub en lugar del tiempo de pared
+    tickers = [f"T{i}" for i in range(8)]
+    stub = StubFetcher(latency=0.2)
+    with DownloadScheduler(fetch_fn=stub, batch_size=1, max_workers=max_workers) as scheduler:
+        df = scheduler.download(tickers)
+
+    assert df.shape[1] == len(tickers)
+    assert stub.peak == max_workers
+
+
+def test_yf_fetch_close_uses_per_ticker_history(monkeypatch):
+    # yfinance falso: solo expone Ticker(t).history, con índice con zona horaria
+    calls = []
+
+    class FakeTicker:
+        def __init__(self, ticker):
+            self.ticker = ticker
+
+        def history(self, **kwargs):
+            calls.append((self.ticker, kwargs))
+            if self.ticker == "BAD":
+                return pd.DataFrame()
+            index = pd.date_range("2025-01-01", periods=2, freq="D", tz="America/New_York")
+            return pd.DataFrame({"Close": [1.0, 2.0]}, index=index)
+
+    monkeypatch.setitem(sys.modules, "yfinance", types.SimpleNamespace(Ticker=FakeTicker))
+
+    df = yf_fetch_close(["AAPL", "BAD"], pd.Timestamp("2025-01-01"), None, None, "1d")
+
+    assert list(df.columns) == ["AAPL"]
+    assert df.index.tz is None
+    assert [ticker for ticker, _ in calls] == ["AAPL", "BAD"]
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from performance.telemetry import aggregate_runs, constraint_table, parse_presolve_log
+
+CPLEX_LOG = """\
+Tried aggregator 1 time.
+LP Presolve eliminated 120 rows and 45 columns.
+Aggregator did 10 substitutions.
+Reduced LP has 300 rows, 400 columns, and 1200 nonzeros.
+Presolve time = 0.00 sec. (0.52 ticks)
+"""
+
+SOLVED_RECORD = {
+    "generated": True,
+    "solved": True,
+    "model": {"rows": 10, "cols": 8, "nonzeros": 30, "assets": 2, "classes": 1, "periods": 2},
+    "cplex_status": 1,
+    "iterations": 7,
+    "solve_time_s": 0.05,
+    "objective": 104.2,
+    "constraints": {
+        "budget": [
+            {"index": [1], "dual": 0.3, "slack": 0.0},
+            {"index": [2], "dual": 0.0, "slack": 5.0},
+        ],
+        "class_min": [{"index": ["Acciones", 1], "dual": -0.1, "slack": 1e-9}],
+    },
+}
+
+
+def write_run(base, name, record=None, results=True, log=None):
+    run_dir = base / name
+    run_dir.mkdir()
+    if results:
+        (run_dir / "results.csv").write_text("Variable,Activo\n")
+    if record is not None:
+        (run_dir / "run_record.json").write_text(json.dumps(record))
+    if log is not None:
+        (run_dir / "cplex.log").write_text(log)
+
+
+def test_parse_presolve_log(tmp_path):
+    log_path = tmp_path / "cplex.log"
+    log_path.write_text(CPLEX_LOG)
+
+    assert parse_presolve_log(str(log_path)) == {
+        "presolve_rows_removed": 120,
+        "presolve_cols_removed": 45,
+        "reduced_rows": 300,
+        "reduced_cols": 400,
+        "reduced_nonzeros": 1200,
+    }
+
+
+def test_parse_presolve_log_without_presolve_lines(tmp_path):
+    log_path = tmp_path / "cplex.log"
+    log_path.write_text("Dual simplex - Optimal:  Objective = 1.0\n")
+
+    assert parse_presolve_log(str(log_path)) == {}
+
+
+def test_constraint_table_binding_uses_tolerance():
+    table = constraint_table(SOLVED_RECORD, tol=1e-6)
+
+    assert list(table["family"]) == ["budget", "budget", "class_min"]
+    assert list(table["binding"]) == [True, False, True]
+    assert table.loc[2, "index"] == ("Acciones", 1)
+
+    strict = constraint_table(SOLVED_RECORD, tol=1e-12)
+    assert list(strict["binding"]) == [True, False, False]
+
+
+def test_aggregate_runs(tmp_path):
+    write_run(tmp_path, "eval1", results=True)
+    write_run(tmp_path, "eval2", record=SOLVED_RECORD, log=CPLEX_LOG)
+    write_run(
+        tmp_path,
+        "eval3",
+        record={"generated": False, "solved": False, "error": "assert failed"},
+        results=False,
+    )
+    write_run(tmp_path, "empty", results=False)
+
+    df = aggregate_runs(str(tmp_path)).set_index("run")
+
+    assert list(df.index) == ["eval1", "eval2", "eval3"]
+    assert not df.loc["eval1", "has_record"]
+
+    solved = df.loc["eval2"]
+    assert solved["solved"]
+    assert solved["objective"] == pytest.approx(104.2)
+    assert solved["budget_binding"] == 1
+    assert solved["budget_abs_dual"] == pytest.approx(0.3)
+    assert solved["class_min_binding"] == 1
+    assert solved["has_presolve_log"]
+    assert solved["presolve_rows_removed"] == 120
+
+    failed = df.loc["eval3"]
+    assert failed["has_record"]
+    assert not failed["generated"]
+    assert failed["error"] == "assert failed"
+    assert not failed["has_presolve_log"]
+
+    assert (tmp_path / "runs_summary.csv").exists()
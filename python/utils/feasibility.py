@@ -0,0 +1,203 @@
+import numpy as np
+import pandas as pd
+from typing import List, Tuple
+
+
+def _limit_arrays(
+    g_matrix: pd.DataFrame,
+    L_c: pd.DataFrame,
+    U_c: pd.DataFrame,
+    x_min: pd.DataFrame,
+    x_max: pd.DataFrame
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Alinea los límites con g_matrix (filas = activos, columnas = clases) y los convierte a arreglos.
+    """
+    G = g_matrix.to_numpy(dtype=float)
+    L = L_c.iloc[:, 0].reindex(g_matrix.columns).to_numpy(dtype=float)
+    U = U_c.iloc[:, 0].reindex(g_matrix.columns).to_numpy(dtype=float)
+    lo = x_min.iloc[:, 0].reindex(g_matrix.index).to_numpy(dtype=float)
+    hi = x_max.iloc[:, 0].reindex(g_matrix.index).to_numpy(dtype=float)
+
+    if np.isnan(L).any() or np.isnan(U).any():
+        raise ValueError("Faltan límites por clase para alguna clase de 'g_matrix'.")
+    if np.isnan(lo).any() or np.isnan(hi).any():
+        raise ValueError("Faltan límites por activo para algún activo de 'g_matrix'.")
+
+    return G, L, U, lo, hi
+
+
+def check_limits(
+    g_matrix: pd.DataFrame,
+    L_c: pd.DataFrame,
+    U_c: pd.DataFrame,
+    x_min: pd.DataFrame,
+    x_max: pd.DataFrame,
+    tol: float = 1e-9
+) -> List[str]:
+    """
+    Verifica condiciones necesarias (no suficientes) para que los límites admitan una cartera.
+
+    Las restricciones de clase y de activo del modelo se expresan sobre el mismo capital W[t],
+    así que entre ellas basta comparar proporciones:
+      - X_min[i] <= X_max[i] y L[c] <= U[c].
+      - sum_{i en c} X_max[i] >= L[c] (capacidad de la clase por debajo de su mínimo).
+      - sum_{i en c} X_min[i] <= U[c] (mínimos de los activos por encima del máximo de la clase).
+
+    El presupuesto, en cambio, acota sum_i x[i][t] por W[t-1], no por W[t]:
+      - sum_c L[c] <= 1 y sum_i X_min[i] <= 1 son solo necesarias. Con sum_c L[c] = s el
+        modelo exige además W[t] <= W[t-1] / s, de modo que s = 1 obliga a que el capital
+        no crezca en ningún período. Que estas verificaciones pasen no garantiza que el
+        modelo sea factible.
+
+    Parámetros:
+    ----
+    - g_matrix: matriz de pertenencia (índice = activos, columnas = clases).
+    - L_c, U_c: límites por clase, como los genera class_limits.
+    - x_min, x_max: límites por activo, como los genera asset_limits.
+    - tol: tolerancia numérica.
+
+    Retorna:
+    ----
+    - Lista de problemas encontrados (vacía si los límites son compatibles).
+    """
+    G, L, U, lo, hi = _limit_arrays(g_matrix, L_c, U_c, x_min, x_max)
+    return _check_arrays(G, L, U, lo, hi, g_matrix.index, g_matrix.columns, tol)
+
+
+def _check_arrays(
+    G: np.ndarray,
+    L: np.ndarray,
+    U: np.ndarray,
+    lo: np.ndarray,
+    hi: np.ndarray,
+    assets: pd.Index,
+    classes: pd.Index,
+    tol: float
+) -> List[str]:
+    """
+    Versión sobre arreglos de check_limits (ver sus reglas).
+    """
+    issues: List[str] = []
+
+    for i in np.flatnonzero(lo > hi + tol):
+        issues.append(f"Activo '{assets[i]}': X_min ({lo[i]:.4f}) > X_max ({hi[i]:.4f}).")
+
+    for c in np.flatnonzero(L > U + tol):
+        issues.append(f"Clase '{classes[c]}': L ({L[c]:.4f}) > U ({U[c]:.4f}).")
+
+    if L.sum() > 1 + tol:
+        issues.append(f"La suma de los mínimos por clase ({L.sum():.4f}) supera 1.")
+
+    if lo.sum() > 1 + tol:
+        issues.append(f"La suma de los mínimos por activo ({lo.sum():.4f}) supera 1.")
+
+    capacity = G.T @ hi
+    for c in np.flatnonzero(capacity < L - tol):
+        issues.append(
+            f"Clase '{classes[c]}': capacidad sum X_max ({capacity[c]:.4f}) < L ({L[c]:.4f})."
+        )
+
+    floor = G.T @ lo
+    for c in np.flatnonzero(floor > U + tol):
+        issues.append(
+            f"Clase '{classes[c]}': sum X_min ({floor[c]:.4f}) > U ({U[c]:.4f})."
+        )
+
+    return issues
+
+
+def tighten_limits(
+    g_matrix: pd.DataFrame,
+    L_c: pd.DataFrame,
+    U_c: pd.DataFrame,
+    x_min: pd.DataFrame,
+    x_max: pd.DataFrame,
+    repair: bool = False,
+    margin: float = 0.05,
+    tol: float = 1e-9
+) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Valida los límites y propaga cotas para ajustar los límites efectivos antes de resolver.
+
+    Si los límites son incompatibles y repair=False, lanza ValueError con los problemas.
+    Si repair=True, relaja los mínimos (nunca los máximos) hasta hacerlos compatibles:
+    X_min y L se recortan a X_max y U, y se escalan a una suma de 1 - margin cuando superan
+    ese valor (con suma 1 el capital no podría crecer; ver check_limits), o a la capacidad
+    de la clase. Los límites finales se vuelven a verificar y, si siguen sin cumplir las
+    condiciones necesarias (p. ej. el ajuste de X_min hace que su suma supere 1), se lanza
+    ValueError.
+
+    Ajuste de cotas (c = clase del activo i):
+      - X_max[i] <- min(X_max[i], U[c])
+      - X_min[i] <- max(X_min[i], L[c] - sum_{j en c, j != i} X_max[j])
+      - U[c] <- min(U[c], sum_{i en c} X_max[i]),  L[c] <- max(L[c], sum_{i en c} X_min[i])
+
+    Retorna:
+    ----
+    - (L_c, U_c, x_min, x_max) ajustados, con el mismo formato que la entrada.
+    """
+    if not 0 <= margin < 1:
+        raise ValueError("'margin' debe estar en [0, 1).")
+
+    issues = check_limits(g_matrix, L_c, U_c, x_min, x_max, tol)
+    if issues and not repair:
+        raise ValueError("Límites infactibles:\n  - " + "\n  - ".join(issues))
+
+    G, L, U, lo, hi = _limit_arrays(g_matrix, L_c, U_c, x_min, x_max)
+
+    # 1. Reparar (solo se relajan los mínimos)
+    if issues:
+        print("Reparando límites infactibles:")
+        for issue in issues:
+            print("  -", issue)
+
+        target = 1 - margin
+        lo = np.minimum(lo, hi)
+        L = np.minimum(L, U)
+        if L.sum() > target:
+            L = L * target / L.sum()
+        if lo.sum() > target:
+            lo = lo * target / lo.sum()
+
+        floor = G.T @ lo
+        scale = np.where(floor > U, U / np.where(floor > 0, floor, 1), 1.0)
+        lo = lo * (G @ scale + (G.sum(axis=1) == 0))
+        L = np.minimum(L, G.T @ hi)
+
+    # 2. Máximo por activo acotado por el máximo de su clase
+    U_asset = np.where(G > 0, U[None, :], np.inf).min(axis=1)
+    hi = np.minimum(hi, U_asset)
+
+    # 3. Mínimo por activo forzado por el mínimo de su clase
+    capacity = G.T @ hi
+    rest = capacity[None, :] - hi[:, None]
+    need = np.where(G > 0, L[None, :] - rest, -np.inf).max(axis=1)
+    lo = np.maximum(lo, need)
+
+    # 4. Límites de clase acotados por los de sus activos
+    U = np.minimum(U, G.T @ hi)
+    L = np.maximum(L, G.T @ lo)
+
+    # 5. Verificar los límites finales (la reparación y el ajuste pueden no bastar)
+    remaining = _check_arrays(G, L, U, lo, hi, g_matrix.index, g_matrix.columns, tol)
+    if remaining:
+        raise ValueError(
+            "Límites infactibles tras la reparación y el ajuste:\n  - " + "\n  - ".join(remaining)
+        )
+
+    return (
+        _to_frame(L, g_matrix.columns, L_c),
+        _to_frame(U, g_matrix.columns, U_c),
+        _to_frame(lo, g_matrix.index, x_min),
+        _to_frame(hi, g_matrix.index, x_max)
+    )
+
+
+def _to_frame(values: np.ndarray, index: pd.Index, like: pd.DataFrame) -> pd.DataFrame:
+    """
+    Reconstruye un DataFrame de una columna con el mismo formato (orden, nombres) que 'like'.
+    """
+    df = pd.Series(values, index=index).reindex(like.index).to_frame(like.columns[0])
+    df.index.name = like.index.name
+    return df